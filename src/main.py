@@ -1,8 +1,9 @@
 ﻿# file: src/main.py
 from __future__ import annotations
 
+import functools
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -11,6 +12,11 @@ import pygame
 # --- Configuração geral ---
 WIDTH, HEIGHT = 960, 540
 FPS = 60
+# Simulação em passos fixos: 1 passo = 1 frame a 60 FPS
+STEP_MS = 1000.0 / FPS
+MAX_STEPS_PER_FRAME = 5
+# Scroll do fundo em ponto fixo (1/256 px por unidade): ~0,3 px por passo
+BG_SCROLL_FP = int(0.3 * 256)
 
 HUD_BLUE = (8, 35, 90)
 HUD_TEXT = (220, 230, 255)
@@ -24,6 +30,8 @@ PIPE_BASE_SPEED = 4.0
 PIPE_SPAWN_BASE_MS = 1500
 
 PLAYER_SPEED = 4.5
+# Passo do navio em ponto fixo (1/256 px), preservando a fração de PLAYER_SPEED
+PLAYER_STEP_FP = int(PLAYER_SPEED * 256)
 PLAYER_MARGIN_TOP_BOTTOM = 20
 INITIAL_LIVES = 3
 
@@ -31,6 +39,14 @@ INITIAL_LIVES = 3
 SERIAL_BAUDRATE = 115200
 SERIAL_FALLBACK_PORT = "COM3"
 SERIAL_DEBUG = False
+SERIAL_POLL_MS = 16
+PICO_PORT_TOKENS = ("pico", "rp2040", "board")
+
+# Eventos tratados pelo loop (os demais nem entram na fila do SDL)
+INPUT_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.WINDOWFOCUSLOST]
+UP_KEYS = frozenset((pygame.K_w, pygame.K_UP))
+DOWN_KEYS = frozenset((pygame.K_s, pygame.K_DOWN))
+START_KEYS = frozenset((pygame.K_SPACE, pygame.K_RETURN))
 
 # Assets
 ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
@@ -50,6 +66,11 @@ MEM_SHOW_MS = 650
 MEM_GAP_MS = 350
 MEM_DEBOUNCE_MS = 200
 
+# Cache de sprites escalados (id da imagem -> Surface original)
+_ICEBERG_SOURCES: dict[int, pygame.Surface] = {}
+# Tamanho (w, h) da estrela, definido ao carregar a imagem
+_STAR_WH: Tuple[int, int] = (0, 0)
+
 # Serial libs (se existirem)
 try:
     import serial  # type: ignore
@@ -62,35 +83,57 @@ except Exception:
 # =========================
 #   Modelos de jogo
 # =========================
+def _empty_rect() -> pygame.Rect:
+    return pygame.Rect(0, 0, 0, 0)
+
+
 @dataclass
 class Player:
     image: pygame.Surface
     rect: pygame.Rect
+    _coll: pygame.Rect = field(
+        default_factory=_empty_rect, init=False, repr=False, compare=False
+    )
+    # Fração de pixel (em 1/256 px) que ainda não virou movimento do rect
+    _y_frac: int = field(default=0, init=False, repr=False, compare=False)
 
-    def update(self, move_up: bool, move_down: bool, dt: float) -> None:
-        dy = 0.0
+    def update(self, move_up: bool, move_down: bool, steps: int) -> None:
+        dy = 0
         if move_up:
-            dy -= PLAYER_SPEED * dt
+            dy -= PLAYER_STEP_FP * steps
         if move_down:
-            dy += PLAYER_SPEED * dt
-        self.rect.y += int(round(dy))
-
-        if self.rect.top < PLAYER_MARGIN_TOP_BOTTOM:
-            self.rect.top = PLAYER_MARGIN_TOP_BOTTOM
-        if self.rect.bottom > HEIGHT - PLAYER_MARGIN_TOP_BOTTOM:
-            self.rect.bottom = HEIGHT - PLAYER_MARGIN_TOP_BOTTOM
+            dy += PLAYER_STEP_FP * steps
+        rect = self.rect
+        y_fp = (rect.y << 8) + self._y_frac + dy
+        y = y_fp >> 8
+        lo = PLAYER_MARGIN_TOP_BOTTOM
+        hi = HEIGHT - PLAYER_MARGIN_TOP_BOTTOM - rect.height
+        if y < lo:
+            rect.y = lo
+            self._y_frac = 0
+        elif y > hi:
+            rect.y = hi
+            self._y_frac = 0
+        else:
+            rect.y = y
+            self._y_frac = y_fp & 0xFF
 
     def draw(self, surf: pygame.Surface) -> None:
         surf.blit(self.image, self.rect)
 
     def collision_rect(self) -> pygame.Rect:
-        r = self.rect.copy()
-        shrink_w = int(r.width * PLAYER_HITBOX_SHRINK)
-        shrink_h = int(r.height * PLAYER_HITBOX_SHRINK)
-        return r.inflate(-shrink_w, -shrink_h)
+        r = self.rect
+        w = r.width
+        h = r.height
+        shrink_w = int(w * PLAYER_HITBOX_SHRINK)
+        shrink_h = int(h * PLAYER_HITBOX_SHRINK)
+        self._coll.update(
+            r.x + shrink_w // 2, r.y + shrink_h // 2, w - shrink_w, h - shrink_h
+        )
+        return self._coll
 
 
-@dataclass
+@dataclass(slots=True)
 class IcebergPair:
     x: float
     gap_y: float
@@ -99,65 +142,149 @@ class IcebergPair:
     passed: bool = False
     star_y: Optional[float] = None
     star_collected: bool = False
+    # Rects reaproveitados entre frames; recalculados in-place após update()
+    _top_rect: pygame.Rect = field(
+        default_factory=_empty_rect, init=False, repr=False, compare=False
+    )
+    _bottom_rect: pygame.Rect = field(
+        default_factory=_empty_rect, init=False, repr=False, compare=False
+    )
+    _coll_top: pygame.Rect = field(
+        default_factory=_empty_rect, init=False, repr=False, compare=False
+    )
+    _coll_bottom: pygame.Rect = field(
+        default_factory=_empty_rect, init=False, repr=False, compare=False
+    )
+    _dirty: bool = field(default=True, init=False, repr=False, compare=False)
+    _star_rect: pygame.Rect = field(
+        default_factory=_empty_rect, init=False, repr=False, compare=False
+    )
+    _half_gap: float = field(default=0.0, init=False, repr=False, compare=False)
 
-    def rects(self) -> Tuple[pygame.Rect, pygame.Rect]:
-        top_height = int(self.gap_y - self.gap / 2)
-        bottom_y = int(self.gap_y + self.gap / 2)
-        bottom_height = HEIGHT - bottom_y
-        top_rect = pygame.Rect(int(self.x), 0, self.width, top_height)
-        bottom_rect = pygame.Rect(int(self.x), bottom_y, self.width, bottom_height)
-        return top_rect, bottom_rect
+    def __post_init__(self) -> None:
+        self._half_gap = self.gap * 0.5
 
-    def collision_rects(self) -> Tuple[pygame.Rect, pygame.Rect]:
-        top_rect, bottom_rect = self.rects()
+    def _refresh(self) -> None:
+        gap_y = self.gap_y
+        top_height = int(gap_y - self._half_gap)
+        bottom_y = int(gap_y + self._half_gap)
+        bottom_height = HEIGHT - bottom_y
+        x = int(self.x)
+        self._top_rect.update(x, 0, self.width, top_height)
+        self._bottom_rect.update(x, bottom_y, self.width, bottom_height)
 
-        def shrink_x(rect: pygame.Rect) -> pygame.Rect:
+        for rect, coll in (
+            (self._top_rect, self._coll_top),
+            (self._bottom_rect, self._coll_bottom),
+        ):
+            coll.update(rect)
             new_w = int(rect.width * ICEBERG_HITBOX_SCALE_X)
-            if new_w <= 0:
-                return rect
-            shrink_total = rect.width - new_w
-            return rect.inflate(-shrink_total, 0)
+            if new_w > 0:
+                coll.inflate_ip(new_w - rect.width, 0)
 
-        return shrink_x(top_rect), shrink_x(bottom_rect)
+        if self.star_y is not None:
+            w, h = _STAR_WH
+            cx = int(self.x + self.width / 2)
+            self._star_rect.update(cx - w // 2, int(self.star_y) - h // 2, w, h)
+        self._dirty = False
 
-    def update(self, speed: float, dt: float) -> None:
-        self.x -= speed * dt
+    def rects(self) -> Tuple[pygame.Rect, pygame.Rect]:
+        if self._dirty:
+            self._refresh()
+        return self._top_rect, self._bottom_rect
+
+    def collision_rects(self) -> Tuple[pygame.Rect, pygame.Rect]:
+        if self._dirty:
+            self._refresh()
+        return self._coll_top, self._coll_bottom
+
+    def update(self, speed: float, steps: int) -> None:
+        self.x -= speed * steps
+        self._dirty = True
 
     def is_off_screen(self) -> bool:
         return self.x + self.width < -10
 
-    def star_rect(self, star_img: pygame.Surface) -> Optional[pygame.Rect]:
+    def star_rect(self) -> Optional[pygame.Rect]:
         if self.star_y is None or self.star_collected:
             return None
-        r = star_img.get_rect()
-        r.centerx = int(self.x + self.width / 2)
-        r.centery = int(self.star_y)
-        return r
-
-    def draw_icebergs(self, surf: pygame.Surface, iceberg_img: pygame.Surface) -> None:
+        if self._dirty:
+            self._refresh()
+        return self._star_rect
+
+    def queue_blits(
+        self,
+        seq: list[Tuple[pygame.Surface, Tuple[int, int]]],
+        iceberg_img: pygame.Surface,
+        iceberg_img_top: pygame.Surface,
+        star_img: pygame.Surface,
+    ) -> None:
+        """Adiciona os icebergs e a estrela a uma sequência para Surface.blits()."""
         top_rect, bottom_rect = self.rects()
+        # Alturas arredondadas para múltiplos de 4 px só no desenho (a colisão
+        # usa os rects exatos); o excesso fica fora da tela.
         if top_rect.height > 0:
-            top_sprite = pygame.transform.smoothscale(iceberg_img, top_rect.size)
-            top_sprite = pygame.transform.flip(top_sprite, False, True)
-            surf.blit(top_sprite, top_rect)
+            th = (top_rect.height + 3) & ~3
+            seq.append(
+                (
+                    _get_scaled_iceberg(id(iceberg_img_top), top_rect.width, th),
+                    (top_rect.x, top_rect.bottom - th),
+                )
+            )
         if bottom_rect.height > 0:
-            bottom_sprite = pygame.transform.smoothscale(iceberg_img, bottom_rect.size)
-            surf.blit(bottom_sprite, bottom_rect)
+            bh = (bottom_rect.height + 3) & ~3
+            seq.append(
+                (
+                    _get_scaled_iceberg(id(iceberg_img), bottom_rect.width, bh),
+                    bottom_rect.topleft,
+                )
+            )
+        s_rect = self.star_rect()
+        if s_rect:
+            seq.append((star_img, s_rect.topleft))
 
 
 # =========================
 #   Utilidades
 # =========================
+def register_iceberg_source(img: pygame.Surface) -> None:
+    _ICEBERG_SOURCES[id(img)] = img
+    _get_scaled_iceberg.cache_clear()
+
+
+def register_star_image(img: pygame.Surface) -> None:
+    global _STAR_WH
+    _STAR_WH = img.get_size()
+
+
+@functools.lru_cache(maxsize=256)
+def _get_scaled_iceberg(img_id: int, w: int, h: int) -> pygame.Surface:
+    """Iceberg escalado reaproveitado entre frames."""
+    return pygame.transform.scale(_ICEBERG_SOURCES[img_id], (w, h))
+
+
 def compute_level(score: int) -> int:
     return max(1, min(10, score // 5 + 1))
 
 
+def compute_difficulty(level: int) -> Tuple[int, float, int]:
+    """(gap, velocidade, intervalo de spawn em ms) para um nível."""
+    gap = max(140, int(PIPE_GAP_BASE - (level - 1) * 8))
+    speed = PIPE_BASE_SPEED + (level - 1) * 0.45
+    spawn_interval_ms = max(700, int(PIPE_SPAWN_BASE_MS - (level - 1) * 80))
+    return gap, speed, spawn_interval_ms
+
+
+# Tabela por nível (índice = nível - 1); compute_level limita o nível a 1..10
+DIFFICULTY_BY_LEVEL = tuple(compute_difficulty(level) for level in range(1, 11))
+
+
 def detect_pico_port() -> Optional[str]:
     if serial is None or list_ports is None:
         return None
     for p in list_ports.comports():
         desc = (p.description or "").lower()
-        if "pico" in desc or "rp2040" in desc or "board" in desc:
+        if any(tok in desc for tok in PICO_PORT_TOKENS):
             return p.device
     if SERIAL_FALLBACK_PORT:
         return SERIAL_FALLBACK_PORT
@@ -183,7 +310,10 @@ def read_pico_flags(ser: Optional["serial.Serial"]) -> Tuple[bool, bool]:
     if ser is None:
         return False, False
     try:
-        data = ser.read(64)
+        waiting = ser.in_waiting
+        if not waiting:
+            return False, False
+        data = ser.read(waiting)
     except Exception as exc:  # noqa: BLE001
         print(f"[WARN] Erro na serial: {exc}")
         return False, False
@@ -191,8 +321,8 @@ def read_pico_flags(ser: Optional["serial.Serial"]) -> Tuple[bool, bool]:
         return False, False
     if SERIAL_DEBUG:
         print(f"[RAW SERIAL] {data!r}")
-    up = b"U" in data
-    down = b"D" in data
+    up = data.find(b"U") != -1
+    down = data.find(b"D") != -1
     return up, down
 
 
@@ -257,6 +387,28 @@ def reset_titanic(ship_image: pygame.Surface):
 
 
 # ----- MEMORY: desenho de setas -----
+@functools.lru_cache(maxsize=None)
+def _get_arrow(
+    direction: str,
+    size: int,
+    color: Tuple[int, int, int],
+) -> Tuple[pygame.Surface, Tuple[int, int]]:
+    """Triângulo pré-renderizado + posição do seu ponto de referência na Surface."""
+    half = size // 2
+    third = size // 3
+    if direction == "U":
+        origin = (third, half)
+        pts = [(0, -half), (-third, third), (third, third)]
+    else:
+        origin = (third, third)
+        pts = [(0, half), (-third, -third), (third, -third)]
+    arrow = pygame.Surface((2 * third + 1, half + third + 1), pygame.SRCALPHA)
+    pygame.draw.polygon(
+        arrow, color, [(origin[0] + dx, origin[1] + dy) for dx, dy in pts]
+    )
+    return arrow, origin
+
+
 def draw_memory_arrow(surface: pygame.Surface, direction: str, progress: float) -> None:
     """Seta animada (subindo) para mostrar a sequência."""
     progress = max(0.0, min(1.0, progress))
@@ -265,63 +417,90 @@ def draw_memory_arrow(surface: pygame.Surface, direction: str, progress: float)
     start_y = HEIGHT + size
     end_y = HEIGHT // 2
     y = int(start_y + (end_y - start_y) * progress)
-    color = (250, 250, 255)
-    if direction == "U":
-        pts = [
-            (x, y - size // 2),
-            (x - size // 3, y + size // 3),
-            (x + size // 3, y + size // 3),
-        ]
-    else:
-        pts = [
-            (x, y + size // 2),
-            (x - size // 3, y - size // 3),
-            (x + size // 3, y - size // 3),
-        ]
-    pygame.draw.polygon(surface, color, pts)
+    arrow, (ox, oy) = _get_arrow(direction, size, (250, 250, 255))
+    surface.blit(arrow, (x - ox, y - oy))
+
+
+@functools.lru_cache(maxsize=64)
+def _row_layout(n: int) -> Tuple[int, Tuple[int, ...]]:
+    """(start_x, posições x) de uma linha centralizada com n setas."""
+    gap = 70
+    total_w = (n - 1) * gap if n else 0
+    start_x = WIDTH // 2 - total_w // 2
+    return start_x, tuple(start_x + i * gap for i in range(n))
+
+
+@functools.lru_cache(maxsize=16)
+def _get_seq_row(
+    seq: Tuple[str, ...],
+    mismatch: frozenset[int],
+    all_green: bool,
+) -> Tuple[pygame.Surface, Tuple[int, int]]:
+    """Linha de setas já composta + deslocamento (x na tela, y do centro)."""
+    size = 40
+    half = size // 2
+    third = size // 3
+    _, xs = _row_layout(len(seq))
+    left = xs[0] - third
+    row = pygame.Surface((xs[-1] - left + third + 1, 2 * half + 1), pygame.SRCALPHA)
+
+    for i, d in enumerate(seq):
+        if all_green:
+            color = (0, 230, 120)
+        elif i in mismatch:
+            color = (230, 70, 90)
+        else:
+            color = (240, 240, 255)
+
+        arrow, (ox, oy) = _get_arrow(d, size, color)
+        row.blit(arrow, (xs[i] - left - ox, half - oy))
+    return row, (left, half)
 
 
 def draw_memory_seq_row(
     surface: pygame.Surface,
     seq: list[str],
     y: int,
-    mismatch: Optional[list[int]] = None,
+    mismatch: frozenset[int] = frozenset(),
     all_green: bool = False,
 ) -> None:
     """Desenha uma linha de setas estáticas (para mostrar resposta / comparação)."""
-    if mismatch is None:
-        mismatch_set: set[int] = set()
-    else:
-        mismatch_set = set(mismatch)
+    if not seq:
+        return
+    row, (left, oy) = _get_seq_row(tuple(seq), mismatch, all_green)
+    surface.blit(row, (left, y - oy))
 
-    gap = 70
-    size = 40
-    total_w = (len(seq) - 1) * gap if seq else 0
-    start_x = WIDTH // 2 - total_w // 2
 
-    for i, d in enumerate(seq):
-        x = start_x + i * gap
+# ----- Textos -----
+_TEXT_CACHE_MAX = 256
+_text_cache: dict[Tuple[int, str, Tuple[int, int, int]], pygame.Surface] = {}
 
-        if all_green:
-            color = (0, 230, 120)
-        elif i in mismatch_set:
-            color = (230, 70, 90)
-        else:
-            color = (240, 240, 255)
 
-        if d == "U":
-            pts = [
-                (x, y - size // 2),
-                (x - size // 3, y + size // 3),
-                (x + size // 3, y + size // 3),
-            ]
-        else:
-            pts = [
-                (x, y + size // 2),
-                (x - size // 3, y - size // 3),
-                (x + size // 3, y - size // 3),
-            ]
-        pygame.draw.polygon(surface, color, pts)
+def render_cached(
+    font: pygame.font.Font,
+    text: str,
+    color: Tuple[int, int, int],
+) -> pygame.Surface:
+    """font.render com cache; textos que mudam (pontos, nível) limitam o tamanho."""
+    key = (id(font), text, color)
+    surf = _text_cache.get(key)
+    if surf is None:
+        if len(_text_cache) >= _TEXT_CACHE_MAX:
+            _text_cache.clear()
+        surf = font.render(text, True, color)
+        _text_cache[key] = surf
+    return surf
+
+
+def _make_overlay(alpha: int) -> pygame.Surface:
+    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+    overlay.fill((0, 0, 0, alpha))
+    return overlay
+
+
+def centered(text: pygame.Surface, y: int) -> Tuple[pygame.Surface, Tuple[int, int]]:
+    """Par (surface, posição) centralizado na horizontal, pronto para blits()."""
+    return text, (WIDTH // 2 - text.get_width() // 2, y)
 
 
 # =========================
@@ -334,24 +513,136 @@ def main() -> None:
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     clock = pygame.time.Clock()
 
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(INPUT_EVENTS)
+
     font_small = pygame.font.SysFont("consolas", 18)
     font_main = pygame.font.SysFont("consolas", 28)
     font_big = pygame.font.SysFont("consolas", 60, bold=True)
 
+    # Telas estáticas: overlay escuro + textos (surface, posição), criados uma vez
+    titanic_menu_overlay = _make_overlay(170)
+    titanic_menu_labels = [
+        centered(font_big.render("TITANIC", True, WHITE), HEIGHT // 2 - 110),
+        centered(
+            font_main.render("Desvie dos icebergs e colete estrelas!", True, WHITE),
+            HEIGHT // 2 - 40,
+        ),
+        centered(
+            font_small.render("W/S, / ou botões do Pico.", True, HUD_TEXT),
+            HEIGHT // 2,
+        ),
+        centered(
+            font_small.render("ESPAÇO / ENTER / botão para começar.", True, HUD_TEXT),
+            HEIGHT // 2 + 40,
+        ),
+        centered(
+            font_small.render("M para voltar ao menu principal.", True, HUD_TEXT),
+            HEIGHT // 2 + 80,
+        ),
+    ]
+    mode_select_overlay = _make_overlay(190)
+    mode_select_labels = [
+        centered(font_big.render("ESCOLHA O JOGO", True, WHITE), HEIGHT // 2 - 120),
+        centered(
+            font_main.render("CIMA (W /  / GP14)    TITANIC", True, HUD_TEXT),
+            HEIGHT // 2 - 20,
+        ),
+        centered(
+            font_main.render("BAIXO (S /  / GP15)   MEMORY", True, HUD_TEXT),
+            HEIGHT // 2 + 20,
+        ),
+        centered(font_small.render("ESC para sair", True, HUD_TEXT), HEIGHT // 2 + 80),
+    ]
+    # Telas com partes dinâmicas: só os textos fixos são renderizados aqui
+    titanic_game_over_overlay = _make_overlay(180)
+    titanic_game_over_labels = [
+        centered(font_big.render("GAME OVER  TITANIC", True, RED), HEIGHT // 2 - 120),
+        centered(
+            font_small.render("Vidas esgotadas!", True, HUD_TEXT), HEIGHT // 2 + 20
+        ),
+        centered(
+            font_small.render("ESPAÇO / ENTER / R para recomeçar", True, HUD_TEXT),
+            HEIGHT // 2 + 50,
+        ),
+        centered(
+            font_small.render(
+                "M para voltar ao menu principal  |  ESC para sair", True, HUD_TEXT
+            ),
+            HEIGHT // 2 + 80,
+        ),
+    ]
+    memory_overlay = _make_overlay(160)
+    memory_labels = [centered(font_big.render("MEMORY", True, WHITE), 60)]
+    # Instrução fixa de cada fase do MEMORY (surface, posição)
+    memory_desc = {
+        "memory_show": centered(
+            font_small.render("Memorize a sequência de setas.", True, WHITE),
+            HEIGHT - 80,
+        ),
+        "memory_input": centered(
+            font_small.render("Sua vez! Use botões do Pico ou W/S, /.", True, WHITE),
+            HEIGHT - 80,
+        ),
+        "memory_success": centered(
+            font_small.render("Correto! Próximo nível...", True, WHITE), HEIGHT - 80
+        ),
+        "memory_ready": centered(
+            font_small.render("Preparando próxima sequência...", True, WHITE),
+            HEIGHT - 80,
+        ),
+    }
+    memory_game_over_overlay = _make_overlay(200)
+    memory_game_over_labels = [
+        centered(font_big.render("GAME OVER  MEMORY", True, RED), HEIGHT // 2 - 130),
+        centered(
+            font_small.render(
+                "Cima: sequência correta  |  Baixo: sua sequência (erros em vermelho)",
+                True,
+                HUD_TEXT,
+            ),
+            HEIGHT // 2 + 5,
+        ),
+        centered(
+            font_small.render(
+                "ESPAÇO / ENTER / R para recomeçar MEMORY", True, HUD_TEXT
+            ),
+            HEIGHT // 2 + 150,
+        ),
+        centered(
+            font_small.render(
+                "M para voltar ao menu principal  |  ESC para sair", True, HUD_TEXT
+            ),
+            HEIGHT // 2 + 180,
+        ),
+    ]
+
     # Imagens
     bg_img = load_image(BACKGROUND_IMAGE_NAME, (WIDTH, HEIGHT), convert_alpha=False)
     ship_raw = load_image(SHIP_IMAGE_NAME)
-    iceberg_raw = load_image(ICEBERG_IMAGE_NAME)
+    # Já reduzido para a largura do iceberg: os redimensionamentos por altura
+    # partem de uma Surface pequena (o PNG tem alpha real, então fica RGBA).
+    iceberg_raw = load_image(ICEBERG_IMAGE_NAME, (PIPE_WIDTH, HEIGHT))
+    iceberg_top = pygame.transform.flip(iceberg_raw, False, True)
+    register_iceberg_source(iceberg_raw)
+    register_iceberg_source(iceberg_top)
     star_img = load_image(STAR_IMAGE_NAME, (32, 32), convert_alpha=True)
-    heart_img = load_image(HEART_IMAGE_NAME, (28, 28), convert_alpha=True)
-    deadheart_img = load_image(DEADHEART_IMAGE_NAME, (28, 28), convert_alpha=True)
+    register_star_image(star_img)
+    heart_img = load_image(HEART_IMAGE_NAME, (28, 28), convert_alpha=False)
+    deadheart_img = load_image(DEADHEART_IMAGE_NAME, (28, 28), convert_alpha=False)
 
-    # Transparência nos corações (usa cor do canto como key)
+    # Transparência nos corações (usa cor do canto como key); corações opacos
+    # no formato da tela + colorkey com RLE usam o blit mais rápido do SDL
     for img in (heart_img, deadheart_img):
         corner_color = img.get_at((0, 0))
-        img.set_colorkey(corner_color)
+        img.set_colorkey(corner_color, pygame.RLEACCEL)
 
-    bg_x = 0.0
+    # Fundo duplicado lado a lado: o scroll vira um único blit de uma janela
+    bg_wide = pygame.Surface((WIDTH * 2, HEIGHT)).convert()
+    bg_wide.blit(bg_img, (0, 0))
+    bg_wide.blit(bg_img, (WIDTH, 0))
+    bg_area = pygame.Rect(0, 0, WIDTH, HEIGHT)
+    bg_x_fp = 0
 
     # Serial
     pico_serial = open_pico_serial()
@@ -368,26 +659,45 @@ def main() -> None:
     mem_last_change = 0
     mem_player_inputs: list[str] = []
     mem_last_input_time = 0
-    mem_mismatch_positions: list[int] = []
+    mem_mismatch_positions: frozenset[int] = frozenset()
 
     # Estado global
     state = "mode_select"  # mode_select, titanic_*, memory_*
     prev_move_up = False
     prev_move_down = False
+    keys_down: set[int] = set()
+    last_serial_poll = 0
+    # Nível só muda quando a pontuação muda
+    cached_score = -1
+    cached_level = 1
+
+    step_acc = 0.0
 
     running = True
     while running:
         dt_ms = clock.tick(FPS)
-        dt = dt_ms / 16.6667
+        # Consome passos inteiros; tolera meio passo de jitter do clock para
+        # não alternar entre 0 e 2 passos com frames de 16/17 ms.
+        step_acc = min(step_acc + dt_ms, MAX_STEPS_PER_FRAME * STEP_MS)
+        steps = int((step_acc + STEP_MS / 2) // STEP_MS)
+        step_acc -= steps * STEP_MS
 
         move_up = move_down = False
 
         # Eventos
-        for event in pygame.event.get():
+        for event in pygame.event.get(INPUT_EVENTS):
             if event.type == pygame.QUIT:
                 running = False
 
+            elif event.type == pygame.KEYUP:
+                keys_down.discard(event.key)
+
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                # Sem foco não chegam KEYUPs; evita teclas "presas"
+                keys_down.clear()
+
             elif event.type == pygame.KEYDOWN:
+                keys_down.add(event.key)
                 if event.key == pygame.K_ESCAPE:
                     running = False
 
@@ -409,20 +719,24 @@ def main() -> None:
                         mem_last_change = 0
                         mem_player_inputs = []
                         mem_last_input_time = 0
-                        mem_mismatch_positions = []
+                        mem_mismatch_positions = frozenset()
                         state = "memory_ready"
                     elif event.key == pygame.K_m:
                         state = "mode_select"
 
-        # Teclado contínuo
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
+        # Teclado contínuo (estado mantido pelos eventos KEYDOWN/KEYUP)
+        if not keys_down.isdisjoint(UP_KEYS):
             move_up = True
-        if keys[pygame.K_s] or keys[pygame.K_DOWN]:
+        if not keys_down.isdisjoint(DOWN_KEYS):
             move_down = True
 
-        # Pico
-        pico_up, pico_down = read_pico_flags(pico_serial)
+        # Pico (no máximo uma leitura a cada SERIAL_POLL_MS; o que chegar
+        # nesse meio tempo fica no buffer para a próxima leitura)
+        pico_up = pico_down = False
+        now = pygame.time.get_ticks()
+        if now - last_serial_poll >= SERIAL_POLL_MS:
+            last_serial_poll = now
+            pico_up, pico_down = read_pico_flags(pico_serial)
         move_up = move_up or pico_up
         move_down = move_down or pico_down
 
@@ -430,6 +744,11 @@ def main() -> None:
         pressed_up = move_up and not prev_move_up
         pressed_down = move_down and not prev_move_down
 
+        if score != cached_score:
+            cached_score = score
+            cached_level = compute_level(score)
+        level = cached_level
+
         # ========= Lógica de estados =========
         if state == "mode_select":
             # Escolha: CIMA => Titanic, BAIXO => Memory
@@ -446,24 +765,20 @@ def main() -> None:
                 mem_last_change = 0
                 mem_player_inputs = []
                 mem_last_input_time = 0
-                mem_mismatch_positions = []
+                mem_mismatch_positions = frozenset()
                 state = "memory_ready"
 
         # ----- Titanic -----
         elif state == "titanic_menu":
-            if keys[pygame.K_SPACE] or keys[pygame.K_RETURN] or move_up or move_down:
+            if move_up or move_down or not keys_down.isdisjoint(START_KEYS):
                 state = "titanic_playing"
 
         elif state == "titanic_playing":
-            level = compute_level(score)
-
             # Player
-            player.update(move_up, move_down, dt)
+            player.update(move_up, move_down, steps)
 
             # Dificuldade
-            gap = max(140, int(PIPE_GAP_BASE - (level - 1) * 8))
-            speed = PIPE_BASE_SPEED + (level - 1) * 0.45
-            spawn_interval_ms = max(700, int(PIPE_SPAWN_BASE_MS - (level - 1) * 80))
+            gap, speed, spawn_interval_ms = DIFFICULTY_BY_LEVEL[level - 1]
 
             now = pygame.time.get_ticks()
             if now >= next_spawn:
@@ -471,18 +786,20 @@ def main() -> None:
                 icebergs.append(create_iceberg_pair(gap_y, gap, star_img))
                 next_spawn = now + spawn_interval_ms
 
+            # Move e remove os que saíram da tela sem criar uma lista nova
+            w = 0
             for ib in icebergs:
-                ib.update(speed, dt)
-            icebergs = [ib for ib in icebergs if not ib.is_off_screen()]
-
-            # Colisão
-            hit = False
-            pcb = player.collision_rect()
+                ib.update(speed, steps)
+                if not ib.is_off_screen():
+                    icebergs[w] = ib
+                    w += 1
+            del icebergs[w:]
+
+            # Colisão (um único collidelist em C para todos os icebergs)
+            colrects: list[pygame.Rect] = []
             for ib in icebergs:
-                t_rect, b_rect = ib.collision_rects()
-                if pcb.colliderect(t_rect) or pcb.colliderect(b_rect):
-                    hit = True
-                    break
+                colrects.extend(ib.collision_rects())
+            hit = player.collision_rect().collidelist(colrects) >= 0
 
             if not hit and (player.rect.top <= 0 or player.rect.bottom >= HEIGHT):
                 hit = True
@@ -499,7 +816,7 @@ def main() -> None:
             # Estrelas
             if state == "titanic_playing":
                 for ib in icebergs:
-                    star_rect = ib.star_rect(star_img)
+                    star_rect = ib.star_rect()
                     if star_rect and player.rect.colliderect(star_rect):
                         ib.star_collected = True
                         score += 1
@@ -510,12 +827,14 @@ def main() -> None:
         # ----- MEMORY -----
         elif state == "memory_ready":
             # gera nova sequência
-            mem_sequence = [random.choice(["U", "D"]) for _ in range(mem_level)]
+            # Um bit aleatório por passo: 1 = CIMA, 0 = BAIXO
+            bits = random.getrandbits(mem_level)
+            mem_sequence = ["U" if (bits >> i) & 1 else "D" for i in range(mem_level)]
             mem_show_index = 0
             mem_showing_arrow = True
             mem_last_change = pygame.time.get_ticks()
             mem_player_inputs = []
-            mem_mismatch_positions = []
+            mem_mismatch_positions = frozenset()
             state = "memory_show"
 
         elif state == "memory_show":
@@ -549,11 +868,11 @@ def main() -> None:
                 mem_player_inputs.append(step)
 
                 if len(mem_player_inputs) >= len(mem_sequence):
-                    mismatch = [
+                    mismatch = frozenset(
                         i
                         for i in range(len(mem_sequence))
                         if mem_player_inputs[i] != mem_sequence[i]
-                    ]
+                    )
                     if mismatch:
                         mem_mismatch_positions = mismatch
                         last_success = mem_level - 1
@@ -580,137 +899,63 @@ def main() -> None:
         #   DESENHO
         # =========================
         # Fundo
-        bg_x -= 0.3 * dt
-        if bg_x <= -WIDTH:
-            bg_x += WIDTH
-        screen.blit(bg_img, (int(bg_x), 0))
-        screen.blit(bg_img, (int(bg_x) + WIDTH, 0))
+        bg_x_fp -= BG_SCROLL_FP * steps
+        if bg_x_fp <= -WIDTH * 256:
+            bg_x_fp += WIDTH * 256
+        bg_area.x = -bg_x_fp >> 8
+        screen.blit(bg_wide, (0, 0), bg_area)
 
         # ----- Titanic draw -----
         if state in ("titanic_menu", "titanic_playing", "titanic_game_over"):
+            # Icebergs, estrelas, navio e vidas em uma única chamada a blits()
+            # (os corações ficam no canto direito, longe do HUD desenhado depois)
+            blit_seq: list[Tuple[pygame.Surface, Tuple[int, int]]] = []
             for ib in icebergs:
-                ib.draw_icebergs(screen, iceberg_raw)
-                s_rect = ib.star_rect(star_img)
-                if s_rect:
-                    screen.blit(star_img, s_rect)
-
-            player.draw(screen)
+                ib.queue_blits(blit_seq, iceberg_raw, iceberg_top, star_img)
+            blit_seq.append((player.image, player.rect.topleft))
 
-            level = compute_level(score)
-            hud_rect = pygame.Rect(10, 10, 260, 60)
-            pygame.draw.rect(screen, HUD_BLUE, hud_rect, border_radius=12)
-
-            text_score = font_main.render(f"Pontos: {score}", True, HUD_TEXT)
-            text_level = font_small.render(f"Nível: {level}/10", True, HUD_TEXT)
-            screen.blit(text_score, (20, 16))
-            screen.blit(text_level, (20, 40))
-
-            # Vidas
             heart_w = heart_img.get_width()
             spacing = 8
             for i in range(INITIAL_LIVES):
                 img = heart_img if i < lives_left else deadheart_img
                 x = WIDTH - (i + 1) * (heart_w + spacing) + spacing
-                y = 14
-                screen.blit(img, (x, y))
+                blit_seq.append((img, (x, 14)))
+            screen.blits(blit_seq, doreturn=False)
+
+            # A lógica acima pode ter mudado a pontuação (estrelas, reinício)
+            if score != cached_score:
+                cached_score = score
+                cached_level = compute_level(score)
+            level = cached_level
+            hud_rect = pygame.Rect(10, 10, 260, 60)
+            pygame.draw.rect(screen, HUD_BLUE, hud_rect, border_radius=12)
 
-            if state == "titanic_menu":
-                overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, 170))
-                screen.blit(overlay, (0, 0))
-
-                title = font_big.render("TITANIC", True, WHITE)
-                line1 = font_main.render(
-                    "Desvie dos icebergs e colete estrelas!",
-                    True,
-                    WHITE,
-                )
-                line2 = font_small.render(
-                    "W/S, / ou botões do Pico.",
-                    True,
-                    HUD_TEXT,
-                )
-                line3 = font_small.render(
-                    "ESPAÇO / ENTER / botão para começar.",
-                    True,
-                    HUD_TEXT,
-                )
-                line4 = font_small.render(
-                    "M para voltar ao menu principal.",
-                    True,
-                    HUD_TEXT,
-                )
+            text_score = render_cached(font_main, f"Pontos: {score}", HUD_TEXT)
+            text_level = render_cached(font_small, f"Nível: {level}/10", HUD_TEXT)
+            screen.blit(text_score, (20, 16))
+            screen.blit(text_level, (20, 40))
 
-                screen.blit(
-                    title,
-                    (WIDTH // 2 - title.get_width() // 2, HEIGHT // 2 - 110),
-                )
-                screen.blit(
-                    line1,
-                    (WIDTH // 2 - line1.get_width() // 2, HEIGHT // 2 - 40),
-                )
-                screen.blit(
-                    line2,
-                    (WIDTH // 2 - line2.get_width() // 2, HEIGHT // 2),
-                )
-                screen.blit(
-                    line3,
-                    (WIDTH // 2 - line3.get_width() // 2, HEIGHT // 2 + 40),
-                )
-                screen.blit(
-                    line4,
-                    (WIDTH // 2 - line4.get_width() // 2, HEIGHT // 2 + 80),
-                )
+            if state == "titanic_menu":
+                screen.blit(titanic_menu_overlay, (0, 0))
+                screen.blits(titanic_menu_labels, doreturn=False)
 
             elif state == "titanic_game_over":
-                overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, 180))
-                screen.blit(overlay, (0, 0))
-
-                level_final = compute_level(score)
-
-                title = font_big.render("GAME OVER  TITANIC", True, RED)
-                txt_score = font_main.render(f"Pontos: {score}", True, WHITE)
-                txt_level = font_main.render(
-                    f"Nível alcançado: {level_final}/10",
-                    True,
-                    WHITE,
-                )
-                txt_lives = font_small.render("Vidas esgotadas!", True, HUD_TEXT)
-                txt_restart = font_small.render(
-                    "ESPAÇO / ENTER / R para recomeçar",
-                    True,
-                    HUD_TEXT,
-                )
-                txt_menu = font_small.render(
-                    "M para voltar ao menu principal  |  ESC para sair",
-                    True,
-                    HUD_TEXT,
-                )
-
-                screen.blit(
-                    title,
-                    (WIDTH // 2 - title.get_width() // 2, HEIGHT // 2 - 120),
-                )
-                screen.blit(
-                    txt_score,
-                    (WIDTH // 2 - txt_score.get_width() // 2, HEIGHT // 2 - 50),
-                )
-                screen.blit(
-                    txt_level,
-                    (WIDTH // 2 - txt_level.get_width() // 2, HEIGHT // 2 - 10),
-                )
-                screen.blit(
-                    txt_lives,
-                    (WIDTH // 2 - txt_lives.get_width() // 2, HEIGHT // 2 + 20),
-                )
-                screen.blit(
-                    txt_restart,
-                    (WIDTH // 2 - txt_restart.get_width() // 2, HEIGHT // 2 + 50),
-                )
-                screen.blit(
-                    txt_menu,
-                    (WIDTH // 2 - txt_menu.get_width() // 2, HEIGHT // 2 + 80),
+                screen.blit(titanic_game_over_overlay, (0, 0))
+                screen.blits(
+                    titanic_game_over_labels
+                    + [
+                        centered(
+                            render_cached(font_main, f"Pontos: {score}", WHITE),
+                            HEIGHT // 2 - 50,
+                        ),
+                        centered(
+                            render_cached(
+                                font_main, f"Nível alcançado: {level}/10", WHITE
+                            ),
+                            HEIGHT // 2 - 10,
+                        ),
+                    ],
+                    doreturn=False,
                 )
 
         # ----- MEMORY draw -----
@@ -721,17 +966,22 @@ def main() -> None:
             "memory_success",
             "memory_game_over",
         ):
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 160))
-            screen.blit(overlay, (0, 0))
-
-            title = font_big.render("MEMORY", True, WHITE)
-            screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 60))
-
-            txt_level = font_main.render(f"Nível: {mem_level}", True, HUD_TEXT)
-            txt_best = font_small.render(f"Recorde: {mem_best_level}", True, HUD_TEXT)
-            screen.blit(txt_level, (WIDTH // 2 - txt_level.get_width() // 2, 140))
-            screen.blit(txt_best, (WIDTH // 2 - txt_best.get_width() // 2, 180))
+            screen.blit(memory_overlay, (0, 0))
+            screen.blits(
+                memory_labels
+                + [
+                    centered(
+                        render_cached(font_main, f"Nível: {mem_level}", HUD_TEXT), 140
+                    ),
+                    centered(
+                        render_cached(
+                            font_small, f"Recorde: {mem_best_level}", HUD_TEXT
+                        ),
+                        180,
+                    ),
+                ],
+                doreturn=False,
+            )
 
             if state == "memory_show":
                 if mem_showing_arrow and mem_show_index < len(mem_sequence):
@@ -741,26 +991,15 @@ def main() -> None:
                     direction = mem_sequence[mem_show_index]
                     draw_memory_arrow(screen, direction, progress)
 
-                desc = font_small.render(
-                    "Memorize a sequência de setas.",
-                    True,
-                    WHITE,
-                )
-                screen.blit(desc, (WIDTH // 2 - desc.get_width() // 2, HEIGHT - 80))
+                screen.blit(*memory_desc["memory_show"])
 
             elif state == "memory_input":
-                desc = font_small.render(
-                    "Sua vez! Use botões do Pico ou W/S, /.",
-                    True,
-                    WHITE,
-                )
-                screen.blit(desc, (WIDTH // 2 - desc.get_width() // 2, HEIGHT - 80))
+                screen.blit(*memory_desc["memory_input"])
                 # Mostra apenas o que o jogador já digitou
                 draw_memory_seq_row(screen, mem_player_inputs, HEIGHT // 2)
 
             elif state == "memory_success":
-                desc = font_small.render("Correto! Próximo nível...", True, WHITE)
-                screen.blit(desc, (WIDTH // 2 - desc.get_width() // 2, HEIGHT - 80))
+                screen.blit(*memory_desc["memory_success"])
                 draw_memory_seq_row(
                     screen,
                     mem_sequence,
@@ -775,54 +1014,25 @@ def main() -> None:
                 )
 
             elif state == "memory_game_over":
-                overlay2 = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-                overlay2.fill((0, 0, 0, 200))
-                screen.blit(overlay2, (0, 0))
-
+                screen.blit(memory_game_over_overlay, (0, 0))
                 last_success = max(0, mem_level - 1)
-
-                title_go = font_big.render("GAME OVER  MEMORY", True, RED)
-                txt_last = font_main.render(
-                    f"Nível alcançado: {last_success}",
-                    True,
-                    WHITE,
-                )
-                txt_best2 = font_main.render(
-                    f"Recorde: {mem_best_level}",
-                    True,
-                    WHITE,
-                )
-                txt_info = font_small.render(
-                    "Cima: sequência correta  |  Baixo: sua sequência (erros em vermelho)",
-                    True,
-                    HUD_TEXT,
-                )
-                txt_restart = font_small.render(
-                    "ESPAÇO / ENTER / R para recomeçar MEMORY",
-                    True,
-                    HUD_TEXT,
-                )
-                txt_menu = font_small.render(
-                    "M para voltar ao menu principal  |  ESC para sair",
-                    True,
-                    HUD_TEXT,
-                )
-
-                screen.blit(
-                    title_go,
-                    (WIDTH // 2 - title_go.get_width() // 2, HEIGHT // 2 - 130),
-                )
-                screen.blit(
-                    txt_last,
-                    (WIDTH // 2 - txt_last.get_width() // 2, HEIGHT // 2 - 60),
-                )
-                screen.blit(
-                    txt_best2,
-                    (WIDTH // 2 - txt_best2.get_width() // 2, HEIGHT // 2 - 25),
-                )
-                screen.blit(
-                    txt_info,
-                    (WIDTH // 2 - txt_info.get_width() // 2, HEIGHT // 2 + 5),
+                screen.blits(
+                    memory_game_over_labels
+                    + [
+                        centered(
+                            render_cached(
+                                font_main, f"Nível alcançado: {last_success}", WHITE
+                            ),
+                            HEIGHT // 2 - 60,
+                        ),
+                        centered(
+                            render_cached(
+                                font_main, f"Recorde: {mem_best_level}", WHITE
+                            ),
+                            HEIGHT // 2 - 25,
+                        ),
+                    ],
+                    doreturn=False,
                 )
 
                 # Sequência correta vs digitada (erros em vermelho)
@@ -839,50 +1049,13 @@ def main() -> None:
                     mismatch=mem_mismatch_positions,
                 )
 
-                screen.blit(
-                    txt_restart,
-                    (WIDTH // 2 - txt_restart.get_width() // 2, HEIGHT // 2 + 150),
-                )
-                screen.blit(
-                    txt_menu,
-                    (WIDTH // 2 - txt_menu.get_width() // 2, HEIGHT // 2 + 180),
-                )
-
             else:  # memory_ready
-                desc = font_small.render(
-                    "Preparando próxima sequência...",
-                    True,
-                    WHITE,
-                )
-                screen.blit(desc, (WIDTH // 2 - desc.get_width() // 2, HEIGHT - 80))
+                screen.blit(*memory_desc["memory_ready"])
 
         # ----- Menu principal (modo) -----
         if state == "mode_select":
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 190))
-            screen.blit(overlay, (0, 0))
-
-            title = font_big.render("ESCOLHA O JOGO", True, WHITE)
-            opt1 = font_main.render("CIMA (W /  / GP14)    TITANIC", True, HUD_TEXT)
-            opt2 = font_main.render("BAIXO (S /  / GP15)   MEMORY", True, HUD_TEXT)
-            info = font_small.render("ESC para sair", True, HUD_TEXT)
-
-            screen.blit(
-                title,
-                (WIDTH // 2 - title.get_width() // 2, HEIGHT // 2 - 120),
-            )
-            screen.blit(
-                opt1,
-                (WIDTH // 2 - opt1.get_width() // 2, HEIGHT // 2 - 20),
-            )
-            screen.blit(
-                opt2,
-                (WIDTH // 2 - opt2.get_width() // 2, HEIGHT // 2 + 20),
-            )
-            screen.blit(
-                info,
-                (WIDTH // 2 - info.get_width() // 2, HEIGHT // 2 + 80),
-            )
+            screen.blit(mode_select_overlay, (0, 0))
+            screen.blits(mode_select_labels, doreturn=False)
 
         pygame.display.flip()
 